@@ -0,0 +1,83 @@
+from FramelessWindow import EffectGovernor, EffectLevel, PowerState
+
+FRAME = 1 / 60
+LEVELS = (EffectLevel.ACRYLIC, EffectLevel.MICA, EffectLevel.SOLID)
+
+
+def idle(t):
+    return 0.002, False, PowerState.NORMAL
+
+
+def heavy_drag(t):
+    # 4 s of slow paints while dragging, then idle
+    if t < 4:
+        return 0.030, True, PowerState.NORMAL
+    return 0.002, False, PowerState.NORMAL
+
+
+def jitter(t):
+    # paint time oscillating around the upper threshold
+    slow = int(t * 4) % 2
+    return (0.024 if slow else 0.012), False, PowerState.NORMAL
+
+
+def battery_saver(t):
+    state = PowerState.BATTERY_SAVER if 2 <= t < 6 else PowerState.NORMAL
+    return 0.002, False, state
+
+
+def run(profile, seconds=15):
+    """ Feed `profile` to a governor, returns the level changes as (t, level) """
+    clock = [0.0]
+    power = [PowerState.NORMAL]
+    governor = EffectGovernor(LEVELS, power_source=lambda: power[0],
+                              clock=lambda: clock[0])
+    changes = []
+    for frame in range(int(seconds / FRAME)):
+        t = clock[0] = frame * FRAME
+        duration, moving, power[0] = profile(t)
+        governor.record_frame(duration)
+        if moving:
+            governor.record_event()
+        if governor.evaluate():
+            changes.append((t, governor.level))
+    return changes
+
+
+def check_idle(changes):
+    assert not changes, "idle changed the level"
+
+
+def check_heavy_drag(changes):
+    levels = [level for t, level in changes]
+    assert EffectLevel.SOLID in levels, "heavy drag never reached SOLID"
+    solid = levels.index(EffectLevel.SOLID)
+    assert changes[solid][0] < 4, "SOLID reached after the drag"
+    assert solid + 1 < len(changes), "never recovered from SOLID"
+    recovered = changes[solid + 1][0]
+    assert recovered >= 4 + EffectGovernor.RECOVER_DELAY, \
+        f"left SOLID at {recovered:.2f}s, before the recover delay"
+    assert levels[-1] == LEVELS[0], "did not come back to the best level"
+
+
+def check_jitter(changes):
+    values = [level.value for t, level in changes]
+    assert values == sorted(values, reverse=True), "jitter made the level flap"
+
+
+def check_battery_saver(changes):
+    levels = [level for t, level in changes]
+    assert levels == [EffectLevel.MICA, EffectLevel.ACRYLIC], \
+        "battery saver did not cap the level at MICA"
+    assert changes[0][0] >= 2 and changes[1][0] >= 6, \
+        "level changed outside of battery saver"
+
+
+if __name__ == '__main__':
+    for profile, check in ((idle, check_idle), (heavy_drag, check_heavy_drag),
+                           (jitter, check_jitter),
+                           (battery_saver, check_battery_saver)):
+        changes = run(profile)
+        check(changes)
+        print(f"{profile.__name__}: " + (", ".join(
+            f"{t:5.2f}s {level.name}" for t, level in changes) or "no change"))
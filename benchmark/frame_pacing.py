@@ -0,0 +1,30 @@
+"""
+Drag and resize the window, the report is written when it is closed.
+
+    python frame_pacing.py [report.json]
+"""
+import json
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from FramelessWindow import FramelessWindow, FramePacingProfiler
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else "frame_pacing.json"
+    app = QApplication(sys.argv[:1])
+    window = FramelessWindow()
+    window.resize(640, 480)
+    window.setWindowTitle("Drag and resize me")
+    profiler = FramePacingProfiler()
+    profiler.attach(window)
+    window.show()
+    app.exec()
+
+    profiler.detach()
+    profiler.write_report(path)
+    report = profiler.report()
+    print(f"{len(report['sessions'])} sessions, "
+          f"{report['dropped_frames']} dropped frames")
+    print(json.dumps(report["latency_ms"]))
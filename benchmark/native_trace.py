@@ -0,0 +1,40 @@
+"""
+Record a trace:  python native_trace.py record drag.fwnt
+Replay a trace:  python native_trace.py replay drag.fwnt [repeat]
+"""
+import os
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from FramelessWindow import FramelessWindow, NativeEventRecorder, \
+    NativeEventReplayer
+
+
+def record(path):
+    app = QApplication(sys.argv)
+    window = FramelessWindow()
+    window.resize(640, 480)
+    window.setWindowTitle("Recording native events, close to finish")
+    recorder = NativeEventRecorder(path)
+    recorder.attach(window)
+    window.show()
+    app.exec()
+    recorder.detach()
+
+
+def replay(path, repeat=10):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    replayer = NativeEventReplayer(path)
+    for _ in range(repeat):
+        print(replayer.replay())
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3 or sys.argv[1] not in ("record", "replay"):
+        sys.exit(__doc__)
+    if sys.argv[1] == "record":
+        record(sys.argv[2])
+    else:
+        replay(sys.argv[2], *map(int, sys.argv[3:4]))
@@ -0,0 +1,67 @@
+import gc
+import os
+import sys
+
+from PySide6.QtCore import Qt, QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+from FramelessWindow import FramelessWindow
+
+CYCLES = 1000
+WARMUP = 50
+MAX_RSS_GROWTH = 16 * 1024 * 1024
+MAX_OBJECT_GROWTH = 500
+
+
+def rss():
+    if sys.platform == "win32":
+        import win32api
+        import win32process
+        process = win32api.GetCurrentProcess()
+        return win32process.GetProcessMemoryInfo(process)["WorkingSetSize"]
+
+    try:
+        import psutil
+    except ImportError:
+        import resource
+        # peak RSS, it still grows when the windows leak
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    return psutil.Process().memory_info().rss
+
+
+def open_close(app):
+    window = FramelessWindow()
+    window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    window.setWindowTitle("Leak")
+    window.show()
+    app.processEvents()
+    window.close()
+    del window
+    # flush deleteLater
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def measure():
+    gc.collect()
+    return rss(), len(gc.get_objects())
+
+
+if __name__ == '__main__':
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    for _ in range(WARMUP):
+        open_close(app)
+    start_rss, start_objects = measure()
+
+    for _ in range(CYCLES):
+        open_close(app)
+    end_rss, end_objects = measure()
+
+    rss_growth = end_rss - start_rss
+    object_growth = end_objects - start_objects
+    print(f"{CYCLES} cycles: RSS {rss_growth / 1024:+.0f} KiB, "
+          f"Python objects {object_growth:+d}")
+    assert rss_growth < MAX_RSS_GROWTH, "RSS keeps growing"
+    assert object_growth < MAX_OBJECT_GROWTH, "Python objects keep growing"
@@ -0,0 +1,45 @@
+import sys
+from statistics import median, quantiles
+from time import perf_counter
+
+from PySide6.QtCore import QPoint
+from PySide6.QtWidgets import QApplication
+
+from FramelessWindow import FramelessWindow, FramelessPopup
+
+CYCLES = 200
+
+
+def report(name, samples):
+    samples = [s * 1000 for s in samples]
+    print(f"{name:>16}: median {median(samples):7.3f} ms, "
+          f"p95 {quantiles(samples, n=20)[-1]:7.3f} ms")
+
+
+def create_and_show(app, factory, show):
+    create, shown = [], []
+    for _ in range(CYCLES):
+        start = perf_counter()
+        window = factory()
+        created = perf_counter()
+        show(window)
+        end = perf_counter()
+        create.append(created - start)
+        shown.append(end - start)
+
+        app.processEvents()
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return create, shown
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    pos = QPoint(100, 100)
+    for name, factory, show in (
+            ("FramelessPopup", FramelessPopup, lambda w: w.popup(pos)),
+            ("FramelessWindow", FramelessWindow, lambda w: w.show())):
+        create, shown = create_and_show(app, factory, show)
+        report(name + " new", create)
+        report(name + " new+show", shown)
@@ -0,0 +1,48 @@
+import sys
+from time import perf_counter
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from FramelessWindow import FramelessWindow, AnimationTicker
+from FramelessWindow.title_bar import TitleBarButtonState
+
+WINDOWS = 30
+IDLE_SECONDS = 2
+
+
+def run_for(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    ticker = AnimationTicker.instance()
+    windows = [FramelessWindow() for _ in range(WINDOWS)]
+    for window in windows:
+        window.show()
+    app.processEvents()
+
+    buttons = []
+    for window in windows:
+        bar = window.title_bar
+        buttons += [bar.min_btn, bar.max_btn, bar.close_btn]
+
+    # hover every button of every window at once
+    start = perf_counter()
+    wakeups = ticker.wakeups
+    for button in buttons:
+        button.set_state(TitleBarButtonState.HOVER)
+    while ticker.is_active():
+        app.processEvents()
+    elapsed = perf_counter() - start
+    print(f"{len(buttons)} transitions: {ticker.wakeups - wakeups} ticks "
+          f"in {elapsed * 1000:.1f} ms")
+
+    wakeups = ticker.wakeups
+    run_for(IDLE_SECONDS)
+    idle_wakeups = ticker.wakeups - wakeups
+    print(f"idle wakeups over {IDLE_SECONDS} s: {idle_wakeups}")
+    assert idle_wakeups == 0
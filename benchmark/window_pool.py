@@ -0,0 +1,59 @@
+import sys
+from statistics import median, quantiles
+from time import perf_counter
+
+from PySide6.QtWidgets import QApplication, QLabel
+
+from FramelessWindow import FramelessWindow, FramelessWindowPool
+
+CYCLES = 100
+
+
+def report(name, samples):
+    samples = [s * 1000 for s in samples]
+    print(f"{name:>10}: median {median(samples):7.3f} ms, "
+          f"p95 {quantiles(samples, n=20)[-1]:7.3f} ms")
+
+
+def open_unpooled(app):
+    samples = []
+    for _ in range(CYCLES):
+        start = perf_counter()
+        window = FramelessWindow()
+        window.setWindowTitle("Unpooled")
+        QLabel("content", window)
+        window.show()
+        app.processEvents()
+        samples.append(perf_counter() - start)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return samples
+
+
+def open_pooled(app):
+    pool = FramelessWindowPool(size=4)
+    pool.prefill()
+    # let the pool fill up in idle time before measuring
+    while pool.idle_count < pool.size:
+        app.processEvents()
+
+    samples = []
+    for _ in range(CYCLES):
+        start = perf_counter()
+        window = pool.acquire(QLabel("content"), "Pooled")
+        window.show()
+        app.processEvents()
+        samples.append(perf_counter() - start)
+        window.close()
+        app.processEvents()
+    recycled = pool.idle_count == pool.size
+    pool.clear()
+    assert recycled, "closed windows were not recycled"
+    return samples
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    report("unpooled", open_unpooled(app))
+    report("pooled", open_pooled(app))
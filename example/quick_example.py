@@ -0,0 +1,36 @@
+import sys
+
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtQml import QQmlComponent
+from PySide6.QtQuick import QQuickWindow, QSGRendererInterface
+
+from FramelessWindow import FramelessQuickWindow
+
+CONTENT_QML = b"""
+import QtQuick
+
+Rectangle {
+    color: "transparent"
+    Text {
+        anchors.centerIn: parent
+        text: "Rendered on the scene graph"
+    }
+}
+"""
+
+
+if __name__ == '__main__':
+    if "--software" in sys.argv:
+        QQuickWindow.setGraphicsApi(QSGRendererInterface.GraphicsApi.Software)
+    app = QGuiApplication(sys.argv)
+    example_win = FramelessQuickWindow()
+    example_win.resize(640, 480)
+    example_win.setTitle("Frameless Quick Window")
+
+    component = QQmlComponent(example_win.engine)
+    component.setData(CONTENT_QML, QUrl())
+    example_win.set_content(component.create())
+
+    example_win.show()
+    sys.exit(app.exec())
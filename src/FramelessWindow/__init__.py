@@ -1 +1,16 @@
-from .frameless_window import FramelessWindow, SYSTEMTHEME
\ No newline at end of file
+from .frameless_window import FramelessWindow, SYSTEMTHEME
+from .popup import FramelessPopup
+from .system_theme import ThemePalette
+from .window_pool import FramelessWindowPool
+from .native_trace import NativeEventRecorder, NativeEventReplayer
+from .animation import AnimationTicker
+from .effect_governor import EffectGovernor, EffectLevel, PowerState
+from .frame_profiler import FramePacingProfiler
+
+
+def __getattr__(name):
+    # QtQml and QtQuick are only imported by users of the Quick window
+    if name == "FramelessQuickWindow":
+        from .quick_window import FramelessQuickWindow
+        return FramelessQuickWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
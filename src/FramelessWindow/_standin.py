@@ -0,0 +1,157 @@
+""" Stand-ins for pywin32, winreg and the Windows DLLs
+
+Every call succeeds and reports a plain, non-maximized window on a
+desktop without taskbar or compositor, so the package can be imported
+and driven headless on other platforms, e.g. to replay native traces
+under the offscreen platform.
+"""
+from collections import namedtuple
+
+
+class win32con:
+    WM_SIZING = 0x0214
+    WM_MOVING = 0x0216
+    WM_ENTERSIZEMOVE = 0x0231
+    WM_EXITSIZEMOVE = 0x0232
+    WM_NCCALCSIZE = 0x0083
+    WM_NCHITTEST = 0x0084
+    WM_SETTINGCHANGE = 0x001A
+    WM_SYSCOMMAND = 0x0112
+
+    HTCAPTION = 2
+    HTLEFT = 10
+    HTRIGHT = 11
+    HTTOP = 12
+    HTTOPLEFT = 13
+    HTTOPRIGHT = 14
+    HTBOTTOM = 15
+    HTBOTTOMLEFT = 16
+    HTBOTTOMRIGHT = 17
+
+    WVR_REDRAW = 0x0300
+    SC_MOVE = 0xF010
+    SW_MAXIMIZE = 3
+    GWL_STYLE = -16
+    WS_MINIMIZEBOX = 0x00020000
+    WS_MAXIMIZEBOX = 0x00010000
+    WS_CAPTION = 0x00C00000
+    WS_THICKFRAME = 0x00040000
+    MONITOR_DEFAULTTOPRIMARY = 1
+    MONITOR_DEFAULTTONEAREST = 2
+    SM_CXSIZEFRAME = 32
+    SM_REMOTESESSION = 0x1000
+
+
+class shellcon:
+    ABM_GETSTATE = 4
+    ABS_AUTOHIDE = 1
+
+
+class win32api:
+    @staticmethod
+    def GetSystemMetrics(index):
+        return 0
+
+    @staticmethod
+    def MonitorFromWindow(h_wnd, flags):
+        return 0
+
+    @staticmethod
+    def GetMonitorInfo(monitor):
+        return None
+
+    @staticmethod
+    def SendMessage(h_wnd, message, w_param, l_param):
+        return 0
+
+
+class win32gui:
+    @staticmethod
+    def GetWindowPlacement(h_wnd):
+        return None
+
+    @staticmethod
+    def GetWindowRect(h_wnd):
+        return None
+
+    @staticmethod
+    def GetWindowLong(h_wnd, index):
+        return 0
+
+    @staticmethod
+    def SetWindowLong(h_wnd, index, value):
+        return 0
+
+    @staticmethod
+    def ReleaseCapture():
+        return None
+
+
+class winreg:
+    HKEY_CURRENT_USER = 0x80000001
+
+    # light theme, default blue accent stored as 0xAABBGGRR
+    VALUES = {
+        "AppsUseLightTheme": 1,
+        "AccentColorMenu": 0xFFD77800,
+    }
+
+    class _Key:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    @classmethod
+    def OpenKey(cls, key, sub_key):
+        return cls._Key()
+
+    @classmethod
+    def QueryValueEx(cls, key, name):
+        return cls.VALUES[name], 4
+
+
+class _Function:
+    def __init__(self):
+        self.argtypes = None
+        self.restype = None
+
+    def __call__(self, *args):
+        return 0
+
+
+class _Library:
+    def __getattr__(self, name):
+        function = _Function()
+        setattr(self, name, function)
+        return function
+
+
+class _LibraryLoader:
+    def __getattr__(self, name):
+        library = _Library()
+        setattr(self, name, library)
+        return library
+
+    def LoadLibrary(self, name):
+        return getattr(self, name)
+
+
+windll = _LibraryLoader()
+cdll = _LibraryLoader()
+
+_WindowsVersion = namedtuple("WindowsVersion", ["major", "minor", "build"])
+
+
+def getwindowsversion():
+    return _WindowsVersion(10, 0, 19045)
+
+
+class WindowsEffects:
+    """ WindowsEffects whose every method does nothing """
+
+    def __getattr__(self, name):
+        def effect(*args, **kwargs):
+            return None
+        return effect
@@ -0,0 +1,78 @@
+from time import perf_counter
+
+from PySide6.QtCore import Qt, QObject, QTimer
+from PySide6.QtGui import QColor
+
+
+def mix_colors(start, end, progress):
+    """ Interpolate two QColor in premultiplied space """
+    r1, g1, b1, a1 = start.getRgbF()
+    r2, g2, b2, a2 = end.getRgbF()
+    alpha = a1 + (a2 - a1) * progress
+    if not alpha:
+        return QColor(Qt.GlobalColor.transparent)
+
+    def channel(c1, c2):
+        value = (c1 * a1 + (c2 * a2 - c1 * a1) * progress) / alpha
+        return min(max(value, 0.0), 1.0)
+
+    return QColor.fromRgbF(
+        channel(r1, r2), channel(g1, g2), channel(b1, b2), alpha)
+
+
+class AnimationTicker(QObject):
+    """ Process-wide clock advancing every running transition once per frame
+
+    A transition is any object with an `advance(now)` method returning
+    whether it is still running. The timer only runs while at least one
+    transition is active.
+    """
+    FRAME_INTERVAL = 16
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.wakeups = 0
+        self._transitions = []
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(self.FRAME_INTERVAL)
+        self._timer.timeout.connect(self._tick)
+
+    def is_active(self):
+        return self._timer.isActive()
+
+    def start(self, transition):
+        """ Advance `transition` on every frame until it finishes """
+        if transition not in self._transitions:
+            self._transitions.append(transition)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, transition):
+        if transition in self._transitions:
+            self._transitions.remove(transition)
+        if not self._transitions:
+            self._timer.stop()
+
+    def _tick(self):
+        self.wakeups += 1
+        now = perf_counter()
+        running = []
+        for transition in self._transitions:
+            try:
+                if transition.advance(now):
+                    running.append(transition)
+            except RuntimeError:
+                # the underlying widget has already been deleted
+                pass
+        self._transitions = running
+        if not running:
+            self._timer.stop()
@@ -0,0 +1,23 @@
+""" Native backend used by the package
+
+pywin32, winreg and the Windows DLLs on Windows. Elsewhere, or when the
+`FRAMELESSWINDOW_BACKEND` environment variable is `standin`, the no-op
+stand-ins from `_standin` are used instead.
+"""
+import os
+import sys
+
+STANDIN = sys.platform != "win32" \
+    or os.environ.get("FRAMELESSWINDOW_BACKEND") == "standin"
+
+if STANDIN:
+    from ._standin import win32api, win32con, win32gui, winreg, shellcon, \
+        windll, cdll, getwindowsversion
+else:
+    import win32api
+    import win32con
+    import win32gui
+    import winreg
+    from ctypes import windll, cdll
+    from sys import getwindowsversion
+    from win32comext.shell import shellcon
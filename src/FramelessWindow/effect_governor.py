@@ -0,0 +1,151 @@
+from collections import deque
+from enum import Enum
+from time import perf_counter
+
+
+class EffectLevel(Enum):
+    SOLID = 0
+    MICA = 1
+    ACRYLIC = 2
+
+
+class PowerState:
+    NORMAL = 0
+    BATTERY_SAVER = 1
+    REMOTE_SESSION = 2
+
+
+def system_power_state():
+    """ Read the power state of the current Windows session """
+    from .utils import is_battery_saver_on, is_remote_session
+
+    state = PowerState.NORMAL
+    if is_battery_saver_on():
+        state |= PowerState.BATTERY_SAVER
+    if is_remote_session():
+        state |= PowerState.REMOTE_SESSION
+    return state
+
+
+class EffectGovernor:
+    """ Step the background effect down under load and back up with hysteresis
+
+    Frame times of the window, the rate of move/resize events and
+    the power state are sampled over a sliding window. The level steps down
+    at most once per `STEP_INTERVAL` while overloaded, and only steps up
+    after the load stayed low for `RECOVER_DELAY`.
+    """
+    SAMPLE_WINDOW = 1.0
+    STEP_INTERVAL = 0.5
+    RECOVER_DELAY = 3.0
+
+    # average frame time in seconds
+    FRAME_TIME_HIGH = 0.020
+    FRAME_TIME_LOW = 0.008
+    # move/resize events per second
+    EVENT_RATE_HIGH = 120
+    EVENT_RATE_LOW = 30
+
+    def __init__(self, levels=(EffectLevel.ACRYLIC, EffectLevel.SOLID),
+                 power_source=system_power_state, clock=perf_counter):
+        """ EffectGovernor
+
+        Parameters
+        ----------
+        levels: tuple
+            available `EffectLevel`, from the best to the cheapest
+
+        power_source: callable
+            returns the current `PowerState` flags, `None` to ignore power
+
+        clock: callable
+            returns the current time in seconds
+        """
+        self.levels = tuple(sorted(levels, key=lambda l: -l.value))
+        self.power_source = power_source
+        self.clock = clock
+
+        self._index = 0
+        self._frames = deque()
+        self._frame_total = 0.0
+        self._events = deque()
+        now = clock()
+        self._last_step = now
+        self._healthy_since = None
+
+    @property
+    def level(self):
+        return self.levels[self._index]
+
+    def record_frame(self, duration, now=None):
+        """ Record the duration of one frame """
+        now = self.clock() if now is None else now
+        self._frames.append((now, duration))
+        self._frame_total += duration
+
+    def record_event(self, now=None):
+        """ Record one move or resize event """
+        self._events.append(self.clock() if now is None else now)
+
+    def frame_time(self):
+        """ Average frame time over the sample window """
+        return self._frame_total / len(self._frames) if self._frames else 0.0
+
+    def event_rate(self):
+        """ Move and resize events per second over the sample window """
+        return len(self._events) / self.SAMPLE_WINDOW
+
+    def evaluate(self, now=None):
+        """ Update the level, returns whether it changed """
+        now = self.clock() if now is None else now
+        self._trim(now)
+
+        ceiling = self._power_ceiling()
+        if self.levels[self._index].value > ceiling.value:
+            return self._step_to(self._index + 1, now)
+
+        frame_time, event_rate = self.frame_time(), self.event_rate()
+        if frame_time > self.FRAME_TIME_HIGH or event_rate > self.EVENT_RATE_HIGH:
+            self._healthy_since = None
+            if now - self._last_step >= self.STEP_INTERVAL:
+                return self._step_to(self._index + 1, now)
+            return False
+
+        if frame_time > self.FRAME_TIME_LOW or event_rate > self.EVENT_RATE_LOW:
+            self._healthy_since = None
+            return False
+
+        if self._healthy_since is None:
+            self._healthy_since = now
+        if (now - self._healthy_since >= self.RECOVER_DELAY
+                and now - self._last_step >= self.RECOVER_DELAY
+                and self._index > 0
+                and self.levels[self._index - 1].value <= ceiling.value):
+            self._healthy_since = now
+            return self._step_to(self._index - 1, now)
+        return False
+
+    def _power_ceiling(self):
+        state = self.power_source() if self.power_source else PowerState.NORMAL
+        if state & PowerState.REMOTE_SESSION:
+            return EffectLevel.SOLID
+        if state & PowerState.BATTERY_SAVER:
+            return EffectLevel.MICA
+        return EffectLevel.ACRYLIC
+
+    def _step_to(self, index, now):
+        index = min(max(index, 0), len(self.levels) - 1)
+        if index == self._index:
+            return False
+        self._index = index
+        self._last_step = now
+        return True
+
+    def _trim(self, now):
+        start = now - self.SAMPLE_WINDOW
+        while self._frames and self._frames[0][0] < start:
+            self._frame_total -= self._frames.popleft()[1]
+        if not self._frames:
+            self._frame_total = 0.0
+        while self._events and self._events[0] < start:
+            self._events.popleft()
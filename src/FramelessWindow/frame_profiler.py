@@ -0,0 +1,169 @@
+import json
+from math import ceil
+from time import perf_counter
+
+from .backend import win32con
+
+
+def percentile(values, q):
+    """ Nearest-rank percentile of `values`, `q` in [0, 100] """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class FramePacingSession:
+    """ Measurements of one drag or resize """
+
+    def __init__(self, start):
+        self.start = start
+        self.end = start
+        self.messages = 0
+        self.coalesced = 0
+        self.latencies = []
+        self.dropped_frames = 0
+        self.fallback_durations = []
+
+    def summary(self):
+        latencies = [l * 1000 for l in self.latencies]
+        fallbacks = [d * 1000 for d in self.fallback_durations]
+        return {
+            "duration_ms": (self.end - self.start) * 1000,
+            "messages": self.messages,
+            "coalesced_messages": self.coalesced,
+            "frames": len(latencies),
+            "dropped_frames": self.dropped_frames,
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies, default=0.0),
+            },
+            "fallback_ms": {
+                "count": len(fallbacks),
+                "total": sum(fallbacks),
+                "max": max(fallbacks, default=0.0),
+            },
+        }
+
+
+class FramePacingProfiler:
+    """ Measure drag and resize frame pacing as seen on screen
+
+    The latency of a frame goes from a `WM_SIZING` message to the moment
+    both the window and its title bar, children included, were painted
+    and flushed to the screen. Qt does not
+    repaint for a pure move, so a `WM_MOVING` frame ends when the window
+    received its move event. Messages arriving before that are coalesced
+    into the same frame, like Qt coalesces update requests. Frames slower
+    than `FRAME_BUDGET` count the frames they missed as dropped.
+    """
+    FRAME_BUDGET = 1 / 60
+
+    WINDOW = "window"
+    TITLE_BAR = "title_bar"
+    MOVE = "move"
+    REPAINT_SOURCES = frozenset((WINDOW, TITLE_BAR))
+
+    def __init__(self, clock=perf_counter):
+        self.clock = clock
+        self.sessions = []
+        self._window = None
+        self._session = None
+        self._pending = None
+        self._waiting = set()
+        self._fallback_start = None
+
+    def attach(self, window):
+        """ Start profiling `window` """
+        self._window = window
+        window.frame_profiler = self
+
+    def detach(self):
+        if self._window is None:
+            return
+        self.end_session()
+        self._window.frame_profiler = None
+        self._window = None
+
+    def mark_native_message(self, message):
+        """ Called for every native message of the window """
+        if message == win32con.WM_ENTERSIZEMOVE:
+            self.begin_session()
+        elif message == win32con.WM_EXITSIZEMOVE:
+            self.end_session()
+        elif message in (win32con.WM_MOVING, win32con.WM_SIZING):
+            if self._session is None:
+                self.begin_session()
+            self._session.messages += 1
+            is_sizing = message == win32con.WM_SIZING
+            if self._pending is None:
+                self._pending = self.clock()
+                self._waiting = set(
+                    self.REPAINT_SOURCES if is_sizing else (self.MOVE,))
+            else:
+                self._session.coalesced += 1
+                if is_sizing and self.MOVE in self._waiting:
+                    self._waiting = set(self.REPAINT_SOURCES)
+
+    def mark_repaint(self, source, now=None):
+        """ Called when `source` finished painting, at `now` if given """
+        if self._pending is None:
+            return
+        self._waiting.discard(source)
+        if self._waiting:
+            return
+        latency = (self.clock() if now is None else now) - self._pending
+        self._pending = None
+        self._session.latencies.append(latency)
+        self._session.dropped_frames += max(
+            ceil(latency / self.FRAME_BUDGET) - 1, 0)
+
+    def mark_moved(self):
+        """ Called when the window received a move event """
+        self.mark_repaint(self.MOVE)
+
+    def mark_fallback(self, visible):
+        """ Called when the opaque fallback is shown or hidden """
+        if visible and self._fallback_start is None:
+            self._fallback_start = self.clock()
+        elif not visible and self._fallback_start is not None:
+            duration = self.clock() - self._fallback_start
+            self._fallback_start = None
+            if self._session is not None:
+                self._session.fallback_durations.append(duration)
+            elif self.sessions:
+                # the fallback usually outlives the drag by the effect timer
+                self.sessions[-1].fallback_durations.append(duration)
+
+    def begin_session(self):
+        self.end_session()
+        self._session = FramePacingSession(self.clock())
+
+    def end_session(self):
+        if self._session is None:
+            return
+        self._session.end = self.clock()
+        self.sessions.append(self._session)
+        self._session = None
+        self._pending = None
+
+    def report(self):
+        """ Per-session summaries and percentiles over every session """
+        latencies = [l * 1000 for s in self.sessions for l in s.latencies]
+        return {
+            "frame_budget_ms": self.FRAME_BUDGET * 1000,
+            "sessions": [s.summary() for s in self.sessions],
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p99": percentile(latencies, 99),
+            },
+            "dropped_frames": sum(s.dropped_frames for s in self.sessions),
+        }
+
+    def write_report(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
@@ -1,62 +1,57 @@
 from ctypes import POINTER, cast
 from ctypes.wintypes import MSG, LPRECT
-from sys import getwindowsversion
+from time import perf_counter
 
-import win32con
-
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QEvent, QTimer
 from PySide6.QtGui import QPainter, QCursor
 from PySide6.QtWidgets import QWidget
 
-from .window_effects import WindowsEffects
+from .backend import win32con, getwindowsversion
+from .window_effects import WindowsEffects, pack_gradient_color
 from .utils import *
 from .system_theme import SYSTEMTHEME
 from .task_bar import Taskbar
 from .title_bar import TitleBar, TitleBarButtonState
+from .effect_governor import EffectGovernor, EffectLevel
+from .frame_profiler import FramePacingProfiler
 
 LPNCCALCSIZE_PARAMS = POINTER(NCCALCSIZE_PARAMS)
 
-class FramelessWindowBase(QWidget):
+class FramelessNativeMixin:
+    """ Native layer shared by the widget and Qt Quick frameless windows
+
+    Handles hit-testing, WM_NCCALCSIZE, the background effect and the
+    theme. Subclasses call `_init_effect_state` and `_init_native_window`
+    from their constructor and may override `_on_effect_changed` and
+    `_teardown_title_bar`.
+    """
     COLOR_LIGHT = "FCFCFC99"
     COLOR_DARK = "2C2C2C99"
     BORDER_WIDTH = 4
-    def __init__(self):
-        """ FramelessWindowBase
-
-        Parameters
-        ----------
-        """
-        super().__init__()
-        self.setObjectName("FramelessWindowBase")
 
-        # set margins for title bar
-        self.setContentsMargins(0, 30, 0, 0)
+    def _init_effect_state(self):
         # self.is_win11 = getwindowsversion().build >= 22000
         self.is_win11 = False
         self.use_mica = self.is_win11
         
         self.effect_enabled = False
+        self.effect_level = EffectLevel.SOLID
+        self.effect_governor = None
+        self._governor_timer = None
+        self.win_effects = None
         self._effect_timer = QTimer(self)
         self._effect_timer.setInterval(100)
         self._effect_timer.setSingleShot(True)
         self._effect_timer.timeout.connect(self.set_effect)
 
         SYSTEMTHEME.Update()
+        self._apply_theme()
 
-        self.is_apply_dark_theme = SYSTEMTHEME.IsDarkTheme
-        self.accent_color = SYSTEMTHEME.AccentColor
-
-        if SYSTEMTHEME.IsDarkTheme:
-            self.acrylic_color = self.COLOR_DARK
-        else:
-            self.acrylic_color = self.COLOR_LIGHT
-
-        self.max_btn_hovered = False
-        self.title_bar = TitleBar(self)
-
+        self.native_recorder = None
+        self.frame_profiler = None
         self.is_add_window_animation = None
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
 
+    def _init_native_window(self):
         self.win_effects = WindowsEffects()
 
         self.win_effects.add_window_animation(self.winId())
@@ -67,13 +62,15 @@ class FramelessWindowBase(QWidget):
         if self.is_win11:
             self.win_effects.add_blur_behind_window(self.winId())
             self.win_effects.add_shadow_effect(self.winId())
-        self.setStyleSheet("FramelessWindowBase { background:transparent; }")
 
+    def _on_effect_changed(self):
+        """ Repaint what depends on the effect, nothing by default """
 
-    def set_effect(self, enable=True):
-        if self.effect_enabled == enable and SYSTEMTHEME.IsDarkTheme == self.is_apply_dark_theme and self.accent_color == SYSTEMTHEME.AccentColor:
-            return
-        
+    def _teardown_title_bar(self):
+        """ Disconnect the title bar, nothing by default """
+
+    def _apply_theme(self):
+        self.theme_version = SYSTEMTHEME.Version
         self.is_apply_dark_theme = SYSTEMTHEME.IsDarkTheme
         self.accent_color = SYSTEMTHEME.AccentColor
 
@@ -81,26 +78,114 @@ class FramelessWindowBase(QWidget):
             self.acrylic_color = self.COLOR_DARK
         else:
             self.acrylic_color = self.COLOR_LIGHT
+        self._acrylic_gradient = pack_gradient_color(self.acrylic_color)
+
+    def _preferred_effect_level(self):
+        level = EffectLevel.MICA if self.use_mica else EffectLevel.ACRYLIC
+        if self.effect_governor and self.effect_governor.level.value < level.value:
+            level = self.effect_governor.level
+        return level
+
+    def set_effect(self, enable=True):
+        if self.win_effects is None:  # torn down
+            return
+        level = self._preferred_effect_level() if enable else EffectLevel.SOLID
+        theme_changed = self.theme_version != SYSTEMTHEME.Version
+        if self.effect_enabled == enable and self.effect_level == level \
+                and not theme_changed:
+            return
+        if theme_changed:
+            self._apply_theme()
 
+        if self.effect_level == EffectLevel.MICA and level != EffectLevel.MICA:
+            # the mica backdrop outlives the accent policy
+            self.win_effects.remove_mica_effect(self.winId())
         self.effect_enabled = enable
-        if enable and self.use_mica:
+        self.effect_level = level
+        if self.frame_profiler:
+            self.frame_profiler.mark_fallback(not enable)
+        if level == EffectLevel.MICA:
             self.win_effects.add_mica_effect(self.winId(), SYSTEMTHEME.IsDarkTheme)
-        elif enable:
+        elif level == EffectLevel.ACRYLIC:
             self.win_effects.add_acrylic_effect(
-                self.winId(), self.acrylic_color)
+                self.winId(), self._acrylic_gradient)
         else:
             self.win_effects.remove_background_effect(self.winId())
-        self.update()
-        self.title_bar.repaint()
+        self._on_effect_changed()
+
+    def enable_effect_governor(self, **kwargs):
+        """ Step the effect down under load, see `EffectGovernor`
+
+        Keyword arguments are passed to `EffectGovernor`. Acrylic steps
+        down to mica on Windows 11, Windows 10 has no mica so it goes
+        straight to the solid fallback.
+        """
+        if self.use_mica:
+            levels = (EffectLevel.MICA, EffectLevel.SOLID)
+        elif getwindowsversion().build >= 22000:
+            levels = (EffectLevel.ACRYLIC, EffectLevel.MICA, EffectLevel.SOLID)
+        else:
+            levels = (EffectLevel.ACRYLIC, EffectLevel.SOLID)
+        kwargs.setdefault("levels", levels)
+        self.effect_governor = EffectGovernor(**kwargs)
+
+        if self._governor_timer is None:
+            self._governor_timer = QTimer(self)
+            self._governor_timer.setInterval(250)
+            self._governor_timer.timeout.connect(self._evaluate_effect_governor)
+        self._governor_timer.start()
+        return self.effect_governor
+
+    def disable_effect_governor(self):
+        if self._governor_timer:
+            self._governor_timer.stop()
+        self.effect_governor = None
+        if self.effect_enabled:
+            self.set_effect()
+
+    def _evaluate_effect_governor(self):
+        # while the effect is suspended the timer will apply the new level
+        if self.effect_governor.evaluate() and self.effect_enabled:
+            self.set_effect()
+
+    def teardown(self):
+        """ Release timers, compositor state and signal connections
+
+        Called on close for windows with `WA_DeleteOnClose`, the window
+        can not be shown again afterwards.
+        """
+        if self.win_effects is None:
+            return
+        self._effect_timer.stop()
+        self._effect_timer.timeout.disconnect(self.set_effect)
+        if self._governor_timer:
+            self._governor_timer.stop()
+            self._governor_timer.timeout.disconnect(
+                self._evaluate_effect_governor)
+        self.effect_governor = None
+        if self.native_recorder:
+            self.native_recorder.detach()
+        if self.frame_profiler:
+            self.frame_profiler.detach()
+
+        self._teardown_title_bar()
+        if self.effect_level == EffectLevel.MICA:
+            self.win_effects.remove_mica_effect(self.winId())
+        self.win_effects.remove_background_effect(self.winId())
+        self.win_effects = None
+        self.effect_enabled = False
+        self.effect_level = EffectLevel.SOLID
 
     def showMaximized(self) -> None:
-        self.win_effects.remove_window_animation(self.winId())
-        self.is_add_window_animation = False
+        if self.win_effects is not None:
+            self.win_effects.remove_window_animation(self.winId())
+            self.is_add_window_animation = False
         return super().showMaximized()
 
     def showNormal(self) -> None:
-        self.win_effects.add_window_animation(self.winId())
-        self.is_add_window_animation = True
+        if self.win_effects is not None:
+            self.win_effects.add_window_animation(self.winId())
+            self.is_add_window_animation = True
         return super().showNormal()
 
     def _temporary_disable_effect(self):
@@ -108,43 +193,17 @@ class FramelessWindowBase(QWidget):
         self._effect_timer.stop()
         self._effect_timer.start()
     
-    def moveEvent(self, event):
-        if self.is_win11 or not self._effect_timer:
-            return super().moveEvent(event)
-        self._temporary_disable_effect()
-
-    def paintEvent(self, event):
-        if self.effect_enabled:
-            return super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setOpacity(0.8)
-        if SYSTEMTHEME.IsDarkTheme:
-            painter.setBrush(Qt.GlobalColor.black)
-        else:
-            painter.setBrush(Qt.GlobalColor.white)
-        painter.drawRect(self.rect())
-
-    def setWindowTitle(self, title):
-        self.title_bar.title.setText(title)
-        super().setWindowTitle(title)
-
-    def setWindowIcon(self, icon):
-        self.title_bar.icon.setFixedWidth(32)
-        self.title_bar.icon.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        self.title_bar.icon.setPixmap(icon.pixmap(16, 16))
-        super().setWindowIcon(icon)
-
-    def resizeEvent(self, event):
-        if not self.title_bar:  # if not initialized
-            return
-        self.title_bar.setFixedWidth(self.width())
-        if not self.use_mica:
-            self._temporary_disable_effect()
-
     def nativeEvent(self, event_type, message):
         msg = MSG.from_address(int(message))
         if not msg.hWnd:
             return False, 0
+        if self.frame_profiler:
+            self.frame_profiler.mark_native_message(msg.message)
+        if self.native_recorder:
+            return self.native_recorder.record(self, msg)
+        return self._handle_native_event(msg)
+
+    def _handle_native_event(self, msg):
         if msg.message == win32con.WM_NCHITTEST:
             pos = QCursor.pos()
             x = pos.x() - self.x()
@@ -208,5 +267,107 @@ class FramelessWindowBase(QWidget):
         return False, 0
 
 
+class FramelessWindowBase(FramelessNativeMixin, QWidget):
+    def __init__(self):
+        """ FramelessWindowBase
+
+        Parameters
+        ----------
+        """
+        super().__init__()
+        self.setObjectName("FramelessWindowBase")
+
+        # set margins for title bar
+        self.setContentsMargins(0, 30, 0, 0)
+        self._init_effect_state()
+
+        self.max_btn_hovered = False
+        self.title_bar = TitleBar(self)
+
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self._init_native_window()
+        self.setStyleSheet("FramelessWindowBase { background:transparent; }")
+
+
+    def _on_effect_changed(self):
+        self.update()
+        self.title_bar.repaint()
+
+    def _teardown_title_bar(self):
+        self.title_bar.teardown()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            is_max = self.isMaximized()
+            self.title_bar.max_btn.is_max = is_max
+            # left the maximized state without showNormal(), e.g. through
+            # setWindowState()
+            if not is_max and self.is_add_window_animation is False \
+                    and self.win_effects is not None:
+                self.win_effects.add_window_animation(self.winId())
+                self.is_add_window_animation = True
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        if event.isAccepted() and \
+                self.testAttribute(Qt.WidgetAttribute.WA_DeleteOnClose):
+            self.teardown()
+
+    def moveEvent(self, event):
+        if self.frame_profiler:
+            self.frame_profiler.mark_moved()
+        if self.effect_governor:
+            self.effect_governor.record_event()
+        if self.is_win11 or not self._effect_timer:
+            return super().moveEvent(event)
+        self._temporary_disable_effect()
+
+    def event(self, event):
+        if event.type() != QEvent.Type.UpdateRequest or not (
+                self.effect_governor or self.frame_profiler):
+            return super().event(event)
+
+        # the update request paints the window with its children and
+        # flushes the backing store, the frame is on screen afterwards
+        start = perf_counter()
+        result = super().event(event)
+        end = perf_counter()
+        if self.effect_governor:
+            self.effect_governor.record_frame(end - start, end)
+        if self.frame_profiler:
+            self.frame_profiler.mark_repaint(FramePacingProfiler.WINDOW, end)
+            self.frame_profiler.mark_repaint(
+                FramePacingProfiler.TITLE_BAR, end)
+        return result
+
+    def paintEvent(self, event):
+        if self.effect_level != EffectLevel.SOLID:
+            return super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setOpacity(0.8)
+        painter.setBrush(SYSTEMTHEME.Palette.fallback_background)
+        painter.drawRect(self.rect())
+
+    def setWindowTitle(self, title):
+        self.title_bar.title.setText(title)
+        super().setWindowTitle(title)
+
+    def setWindowIcon(self, icon):
+        self.title_bar.icon.setFixedWidth(32)
+        self.title_bar.icon.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+        self.title_bar.icon.setPixmap(icon.pixmap(16, 16))
+        super().setWindowIcon(icon)
+
+    def resizeEvent(self, event):
+        if not self.title_bar:  # if not initialized
+            return
+        self.title_bar.setFixedWidth(self.width())
+        if self.effect_governor:
+            self.effect_governor.record_event()
+        if not self.use_mica:
+            self._temporary_disable_effect()
+
+
 FramelessWindow = FramelessWindowBase
     
\ No newline at end of file
@@ -0,0 +1,413 @@
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from ctypes import POINTER, addressof, cast
+from ctypes.wintypes import MSG, LPRECT, RECT
+from struct import Struct
+from time import perf_counter
+
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QCursor
+
+from . import frameless_window
+from ._standin import WindowsEffects as StandInWindowsEffects
+from .backend import win32con
+from .frameless_window import FramelessNativeMixin, FramelessWindowBase
+from .system_theme import SYSTEMTHEME
+from .task_bar import Taskbar
+from .utils import NCCALCSIZE_PARAMS
+
+TRACE_MAGIC = b"FWNT"
+TRACE_VERSION = 1
+
+# magic, version
+HEADER = Struct("<4sH")
+# message, wParam, lParam, timestamp, window x, y, width, height
+EVENT = Struct("<IQqd4i")
+# handled, result, number of answers
+RESULT = Struct("<?qH")
+# answer kind, value
+ANSWER = Struct("<Bq")
+# left, top, right, bottom
+RECT_VALUE = Struct("<4i")
+
+TraceEvent = namedtuple(
+    "TraceEvent",
+    ["message", "w_param", "l_param", "timestamp", "geometry",
+     "handled", "result", "answers", "rect_in", "rect_out"]
+)
+
+
+class TraceAnswer:
+    """ Kinds of native lookups answered by `utils` and `Taskbar` """
+    IS_MAXIMIZED = 0
+    IS_FULL_SCREEN = 1
+    RESIZE_BORDER_THICKNESS = 2
+    TASKBAR_AUTO_HIDE = 3
+    TASKBAR_POSITION = 4
+    CURSOR_X = 5
+    CURSOR_Y = 6
+
+
+def _patch_lookups(is_maximized, is_full_screen, get_resize_border_thickness,
+                   is_auto_hide, get_position, cursor_pos):
+    """ Replace the lookups used by `nativeEvent`, returns the originals """
+    class TaskbarProxy(Taskbar):
+        pass
+    TaskbarProxy.is_auto_hide = staticmethod(is_auto_hide)
+    TaskbarProxy.get_position = staticmethod(get_position)
+
+    class CursorProxy:
+        pos = staticmethod(cursor_pos)
+
+    replacements = {
+        "is_maximized": is_maximized,
+        "is_full_screen": is_full_screen,
+        "get_resize_border_thickness": get_resize_border_thickness,
+        "Taskbar": TaskbarProxy,
+        "QCursor": CursorProxy,
+    }
+    originals = {}
+    for name, value in replacements.items():
+        originals[name] = getattr(frameless_window, name)
+        setattr(frameless_window, name, value)
+    return originals
+
+
+def _restore_lookups(originals):
+    for name, value in originals.items():
+        setattr(frameless_window, name, value)
+
+
+@contextmanager
+def _stubbed_theme_update():
+    update = SYSTEMTHEME.__dict__["Update"]
+    SYSTEMTHEME.Update = classmethod(lambda cls: None)
+    try:
+        yield
+    finally:
+        SYSTEMTHEME.Update = update
+
+
+def _calc_size_rect(msg):
+    if msg.wParam:
+        return cast(msg.lParam, POINTER(NCCALCSIZE_PARAMS)).contents.rgrc[0]
+    return cast(msg.lParam, LPRECT).contents
+
+
+def _rect_tuple(rect):
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
+class NativeEventRecorder:
+    """ Record the native message stream of a window into a trace file
+
+    Handlers can re-enter, e.g. `WM_SETTINGCHANGE` may send messages
+    synchronously, so answers are collected on a stack of running handlers
+    and events are written in the order they started. Lookups made by the
+    handlers of other windows are not recorded.
+    """
+
+    def __init__(self, path):
+        """ NativeEventRecorder
+
+        Parameters
+        ----------
+        path: str
+            path of the binary trace file
+        """
+        self.path = path
+        self._file = None
+        self._window = None
+        self._originals = None
+        self._original_handler = None
+        # (h_wnd, answers) of the running handlers, innermost last,
+        # answers is None for the handlers of other windows
+        self._frames = []
+        # encoded events in the order they started
+        self._records = []
+
+    def attach(self, window):
+        """ Start recording the messages seen by `window.nativeEvent` """
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION))
+        self._window = window
+        self._originals = _patch_lookups(
+            self._recording(TraceAnswer.IS_MAXIMIZED,
+                            frameless_window.is_maximized),
+            self._recording(TraceAnswer.IS_FULL_SCREEN,
+                            frameless_window.is_full_screen),
+            self._recording(TraceAnswer.RESIZE_BORDER_THICKNESS,
+                            frameless_window.get_resize_border_thickness),
+            self._recording(TraceAnswer.TASKBAR_AUTO_HIDE,
+                            Taskbar.is_auto_hide),
+            self._recording(TraceAnswer.TASKBAR_POSITION,
+                            Taskbar.get_position),
+            self._record_cursor_pos
+        )
+
+        # the lookups are patched for every window, give the handlers of
+        # the other windows a frame that drops their answers
+        original = self._original_handler = \
+            FramelessNativeMixin._handle_native_event
+
+        def handle_other_window(other, msg):
+            self._frames.append((None, None))
+            try:
+                return original(other, msg)
+            finally:
+                self._frames.pop()
+                self._flush()
+
+        FramelessNativeMixin._handle_native_event = handle_other_window
+        window.native_recorder = self
+
+    def detach(self):
+        """ Stop recording and close the trace file """
+        if self._window is None:
+            return
+        self._window.native_recorder = None
+        FramelessNativeMixin._handle_native_event = self._original_handler
+        _restore_lookups(self._originals)
+        self._frames = []
+        self._flush()
+        self._file.close()
+        self._file = None
+        self._window = None
+        self._originals = None
+        self._original_handler = None
+
+    def record(self, window, msg):
+        h_wnd = int(msg.hWnd)
+        answers = []
+        index = len(self._records)
+        self._records.append(b"")
+        timestamp = perf_counter()
+        # the state the handler sees, the replay applies it before the handler
+        geometry = window.x(), window.y(), window.width(), window.height()
+        is_calc_size = msg.message == win32con.WM_NCCALCSIZE
+        if is_calc_size:
+            rect_in = _rect_tuple(_calc_size_rect(msg))
+
+        self._frames.append((h_wnd, answers))
+        try:
+            handled, result = self._original_handler(window, msg)
+        finally:
+            self._frames.pop()
+
+        record = [
+            EVENT.pack(msg.message, msg.wParam or 0, msg.lParam or 0,
+                       timestamp, *geometry),
+            RESULT.pack(handled, int(result), len(answers))
+        ]
+        record += [ANSWER.pack(kind, value) for kind, value in answers]
+        if is_calc_size:
+            record.append(RECT_VALUE.pack(*rect_in))
+            record.append(RECT_VALUE.pack(*_rect_tuple(_calc_size_rect(msg))))
+        self._records[index] = b"".join(record)
+        self._flush()
+        return handled, result
+
+    def _flush(self):
+        # only the outermost handler writes, nested events are complete then
+        if self._frames or not self._records:
+            return
+        self._file.write(b"".join(self._records))
+        self._records = []
+
+    def _add_answer(self, kind, value, h_wnd=None):
+        if not self._frames:
+            return
+        frame_h_wnd, answers = self._frames[-1]
+        if answers is None:
+            return
+        if h_wnd is not None and int(h_wnd) != frame_h_wnd:
+            return
+        answers.append((kind, int(value)))
+
+    def _recording(self, kind, func):
+        def wrapper(*args):
+            value = func(*args)
+            self._add_answer(kind, value, args[0] if args else None)
+            return value
+        return wrapper
+
+    def _record_cursor_pos(self):
+        pos = QCursor.pos()
+        self._add_answer(TraceAnswer.CURSOR_X, pos.x())
+        self._add_answer(TraceAnswer.CURSOR_Y, pos.y())
+        return pos
+
+
+class ReplayWindow(FramelessWindowBase):
+    """ FramelessWindow with stubbed effects and theme, to replay traces
+
+    Its background effects never reach the compositor and the theme is not
+    read from the system, so replays behave the same on any desktop.
+    """
+
+    def __init__(self):
+        with _stubbed_theme_update():
+            super().__init__()
+
+    def _init_native_window(self):
+        self.win_effects = StandInWindowsEffects()
+        self.is_add_window_animation = True
+        self.set_effect()
+
+
+def read_trace(path):
+    """ Load every event of a trace file """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version = HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError(f"{path} is not a native event trace")
+
+    events = []
+    offset = HEADER.size
+    while offset < len(data):
+        message, w_param, l_param, timestamp, *geometry = \
+            EVENT.unpack_from(data, offset)
+        offset += EVENT.size
+        handled, result, count = RESULT.unpack_from(data, offset)
+        offset += RESULT.size
+        answers = []
+        for _ in range(count):
+            answers.append(ANSWER.unpack_from(data, offset))
+            offset += ANSWER.size
+
+        rect_in = rect_out = None
+        if message == win32con.WM_NCCALCSIZE:
+            rect_in = RECT_VALUE.unpack_from(data, offset)
+            rect_out = RECT_VALUE.unpack_from(data, offset + RECT_VALUE.size)
+            offset += 2 * RECT_VALUE.size
+
+        events.append(TraceEvent(
+            message, w_param, l_param, timestamp, tuple(geometry),
+            handled, result, answers, rect_in, rect_out))
+    return events
+
+
+class ReplayReport:
+    """ Throughput and divergence of a trace replay """
+
+    def __init__(self, events, seconds, divergences):
+        self.events = events
+        self.seconds = seconds
+        self.divergences = divergences
+
+    @property
+    def throughput(self):
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.events} events in {self.seconds * 1000:.3f} ms "
+                f"({self.throughput:.0f} events/s), "
+                f"{len(self.divergences)} divergent")
+
+
+class NativeEventReplayer:
+    """ Feed a recorded trace into a window and compare the results
+
+    The native lookups are answered from the trace, so a replay does not
+    need the desktop, monitor or taskbar it was recorded on.
+    """
+
+    def __init__(self, path):
+        self.events = read_trace(path)
+        self.window = None
+        self._answers = deque()
+        self._mismatch = False
+
+    def replay(self, window=None):
+        """ Replay the trace, returns a `ReplayReport`
+
+        Replays into a `ReplayWindow` unless `window` is given.
+        """
+        if window is None:
+            if self.window is None:
+                self.window = ReplayWindow()
+            window = self.window
+
+        with _stubbed_theme_update():
+            return self._replay(window)
+
+    def _replay(self, window):
+        originals = _patch_lookups(
+            self._answering(TraceAnswer.IS_MAXIMIZED),
+            self._answering(TraceAnswer.IS_FULL_SCREEN),
+            self._answering(TraceAnswer.RESIZE_BORDER_THICKNESS),
+            self._answering(TraceAnswer.TASKBAR_AUTO_HIDE),
+            self._answering(TraceAnswer.TASKBAR_POSITION),
+            self._answer_cursor_pos
+        )
+        h_wnd = int(window.winId()) or 1
+        divergences = []
+        elapsed = 0.0
+        try:
+            for index, event in enumerate(self.events):
+                self._apply_geometry(window, event.geometry)
+                msg, rect = self._build_message(h_wnd, event)
+                self._answers = deque(event.answers)
+                self._mismatch = False
+
+                start = perf_counter()
+                handled, result = window._handle_native_event(msg)
+                elapsed += perf_counter() - start
+
+                if (self._mismatch or self._answers
+                        or handled != event.handled
+                        or int(result) != event.result
+                        or (rect is not None
+                            and _rect_tuple(rect) != event.rect_out)):
+                    divergences.append(index)
+        finally:
+            _restore_lookups(originals)
+
+        return ReplayReport(len(self.events), elapsed, divergences)
+
+    @staticmethod
+    def _apply_geometry(window, geometry):
+        x, y, width, height = geometry
+        if window.x() != x or window.y() != y:
+            window.move(x, y)
+        if window.width() != width or window.height() != height:
+            window.resize(width, height)
+
+    @staticmethod
+    def _build_message(h_wnd, event):
+        msg = MSG()
+        msg.hWnd = h_wnd
+        msg.message = event.message
+        msg.wParam = event.w_param
+        msg.lParam = event.l_param
+        if event.rect_in is None:
+            return msg, None
+
+        # lParam pointed into the recording process, give it fresh memory
+        if event.w_param:
+            params = NCCALCSIZE_PARAMS()
+            rect = params.rgrc[0]
+        else:
+            params = rect = RECT()
+        rect.left, rect.top, rect.right, rect.bottom = event.rect_in
+        msg.lParam = addressof(params)
+        # keep the buffer alive for as long as the message
+        msg._buffer = params
+        return msg, rect
+
+    def _next_answer(self, kind):
+        if not self._answers or self._answers[0][0] != kind:
+            self._mismatch = True
+            return 0
+        return self._answers.popleft()[1]
+
+    def _answering(self, kind):
+        def answer(*args):
+            return self._next_answer(kind)
+        return answer
+
+    def _answer_cursor_pos(self):
+        return QPoint(self._next_answer(TraceAnswer.CURSOR_X),
+                      self._next_answer(TraceAnswer.CURSOR_Y))
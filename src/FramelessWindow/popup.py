@@ -0,0 +1,67 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QWidget
+
+from .frameless_window import FramelessNativeMixin
+from .system_theme import SYSTEMTHEME
+from .window_effects import shared_window_effects, pack_gradient_color
+
+_theme_read = False
+
+
+def _read_theme_once():
+    # popups may be used without any FramelessWindow reading the theme
+    global _theme_read
+    if not _theme_read:
+        _theme_read = True
+        SYSTEMTHEME.Update()
+
+
+class FramelessPopup(QWidget):
+    """ Lightweight frameless acrylic surface for menus, tooltips and flyouts
+
+    Has no title bar, no resize hit-testing and no effect timer. The native
+    window is only created when the popup is first shown, and the effect is
+    applied through a `WindowsEffects` instance shared by every popup.
+
+    The system theme is read when the first popup is shown. Popups have no
+    `nativeEvent`, later theme changes are picked up through the shared
+    `SYSTEMTHEME`, updated by any `FramelessWindow` on `WM_SETTINGCHANGE`
+    or by calling `SYSTEMTHEME.Update()`.
+    """
+    COLOR_LIGHT = FramelessNativeMixin.COLOR_LIGHT
+    COLOR_DARK = FramelessNativeMixin.COLOR_DARK
+
+    def __init__(self, parent=None, flags=Qt.WindowType.Popup):
+        """ FramelessPopup
+
+        Parameters
+        ----------
+        parent: QWidget
+            parent widget
+
+        flags: Qt.WindowType
+            window type, `Qt.WindowType.ToolTip` for tooltips
+        """
+        super().__init__(parent, flags | Qt.WindowType.FramelessWindowHint)
+        self._theme_version = None
+
+        # cheaper than a style sheet for a transparent background
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.transparent)
+        self.setPalette(palette)
+
+    def popup(self, pos):
+        """ Show the popup with its top left corner at `pos` """
+        self.move(pos)
+        self.show()
+
+    def showEvent(self, event):
+        _read_theme_once()
+        if self._theme_version != SYSTEMTHEME.Version:
+            self._theme_version = SYSTEMTHEME.Version
+            color = self.COLOR_DARK if SYSTEMTHEME.IsDarkTheme \
+                else self.COLOR_LIGHT
+            shared_window_effects().add_acrylic_effect(
+                self.winId(), pack_gradient_color(color))
+        super().showEvent(event)
@@ -0,0 +1,332 @@
+from time import perf_counter
+
+from PySide6.QtCore import Qt, QUrl, QObject, Signal, SIGNAL
+from PySide6.QtGui import QColor, QWindow
+from PySide6.QtQml import QQmlEngine, QQmlComponent
+from PySide6.QtQuick import QQuickWindow
+
+from .backend import win32api, win32con, win32gui
+from .frameless_window import FramelessNativeMixin
+from .system_theme import SYSTEMTHEME
+from .effect_governor import EffectLevel
+from .frame_profiler import FramePacingProfiler
+
+TITLE_BAR_QML = b"""
+import QtQuick
+
+Item {
+    id: root
+    anchors.fill: parent
+
+    property string title
+    property bool maximized: false
+    property color textColor: "black"
+    property color iconColor: "black"
+    property color hoverColor: "#20000000"
+    property color pressedColor: "#40000000"
+    property alias content: contentArea
+
+    signal minimizeRequested()
+    signal maximizeRequested()
+    signal closeRequested()
+    signal moveRequested()
+
+    component TitleBarButton: Rectangle {
+        id: button
+        property color hover
+        property color pressed
+        signal clicked()
+
+        width: 46
+        height: 32
+        color: mouse.pressed ? pressed
+             : mouse.containsMouse ? hover : "transparent"
+        Behavior on color { ColorAnimation { duration: 150 } }
+
+        MouseArea {
+            id: mouse
+            anchors.fill: parent
+            hoverEnabled: true
+            onClicked: button.clicked()
+        }
+    }
+
+    Item {
+        id: titleBar
+        height: 32
+        anchors { left: parent.left; right: parent.right; top: parent.top }
+
+        MouseArea {
+            anchors.fill: parent
+            onPositionChanged: if (pressed) root.moveRequested()
+            onDoubleClicked: root.maximizeRequested()
+        }
+
+        Text {
+            text: root.title
+            color: root.textColor
+            anchors { left: parent.left; leftMargin: 10; verticalCenter: parent.verticalCenter }
+        }
+
+        Row {
+            anchors.right: parent.right
+
+            TitleBarButton {
+                hover: root.hoverColor
+                pressed: root.pressedColor
+                onClicked: root.minimizeRequested()
+                Rectangle {
+                    x: 18; y: 16; width: 10; height: 1
+                    color: root.iconColor
+                }
+            }
+            TitleBarButton {
+                hover: root.hoverColor
+                pressed: root.pressedColor
+                onClicked: root.maximizeRequested()
+                Rectangle {
+                    x: 18; y: root.maximized ? 13 : 11
+                    width: root.maximized ? 8 : 10
+                    height: width
+                    color: "transparent"
+                    border.color: root.iconColor
+                }
+            }
+            TitleBarButton {
+                hover: "#C42B1C"
+                pressed: "#C83C30"
+                onClicked: root.closeRequested()
+                Text {
+                    anchors.centerIn: parent
+                    text: "\\u2715"
+                    color: parent.color.a > 0 ? "white" : root.iconColor
+                }
+            }
+        }
+    }
+
+    Item {
+        id: contentArea
+        anchors { left: parent.left; right: parent.right; top: titleBar.bottom; bottom: parent.bottom }
+        onChildrenChanged: {
+            for (let i = 0; i < children.length; ++i)
+                children[i].anchors.fill = contentArea
+        }
+    }
+}
+"""
+
+
+class FramelessQuickWindow(FramelessNativeMixin, QQuickWindow):
+    """ Frameless window rendering its title bar on the Qt Quick scene graph
+
+    Shares hit-testing, WM_NCCALCSIZE handling, the background effects and
+    the theme with `FramelessWindow`. Call
+    `QQuickWindow.setGraphicsApi(QSGRendererInterface.GraphicsApi.Software)`
+    before creating the window to use the software scene graph backend.
+
+    Closing only hides the window, it can be shown again. Call `teardown`
+    before dropping it for good.
+    """
+
+    # duration and end of a frame, emitted by the render thread
+    _frame_timed = Signal(float, float)
+
+    def __init__(self, engine=None):
+        """ FramelessQuickWindow
+
+        Parameters
+        ----------
+        engine: QQmlEngine
+            engine used to create the title bar and the content,
+            a new engine is created if it is `None`
+        """
+        super().__init__()
+        self.setObjectName("FramelessQuickWindow")
+        self.setFlags(Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint)
+        surface_format = self.format()
+        surface_format.setAlphaBufferSize(8)
+        self.setFormat(surface_format)
+
+        self._frame_start = None
+        self._frame_timing = False
+        self._frame_timed.connect(
+            self._record_frame, Qt.ConnectionType.QueuedConnection)
+
+        self._init_effect_state()
+        self._title_bar_theme = None
+        self._native_window = None
+
+        self.engine = engine or QQmlEngine(self)
+        component = QQmlComponent(self.engine)
+        component.setData(TITLE_BAR_QML, QUrl())
+        self.root = component.create()
+        if self.root is None:
+            raise RuntimeError(component.errorString())
+        # the window owns the title bar, the engine could collect it otherwise
+        self.root.setParent(self)
+        self.root.setParentItem(self.contentItem())
+
+        self._title_bar_connections = (
+            ("minimizeRequested()", self.showMinimized),
+            ("maximizeRequested()", self._toggle_max_state),
+            ("closeRequested()", self.close),
+            ("moveRequested()", self._start_move),
+        )
+        for signal, slot in self._title_bar_connections:
+            QObject.connect(self.root, SIGNAL(signal), slot)
+
+        self._init_native_window()
+
+    @property
+    def effect_governor(self):
+        return self._effect_governor
+
+    @effect_governor.setter
+    def effect_governor(self, governor):
+        self._effect_governor = governor
+        self._update_frame_timing()
+
+    @property
+    def frame_profiler(self):
+        return self._frame_profiler
+
+    @frame_profiler.setter
+    def frame_profiler(self, profiler):
+        self._frame_profiler = profiler
+        self._update_frame_timing()
+
+    @property
+    def content_item(self):
+        """ Item below the title bar, its children fill it """
+        return self.root.property("content")
+
+    def set_content(self, item):
+        content = self.content_item
+        item.setParent(content)
+        item.setParentItem(content)
+
+    def load_content(self, url):
+        """ Create the QML component at `url` as the content """
+        component = QQmlComponent(self.engine, QUrl(url))
+        item = component.create()
+        if item is None:
+            raise RuntimeError(component.errorString())
+        self.set_content(item)
+        return item
+
+    def setTitle(self, title):
+        self.root.setProperty("title", title)
+        super().setTitle(title)
+
+    def _apply_title_bar_theme(self):
+        palette = SYSTEMTHEME.Palette
+        if self._title_bar_theme == palette.version:
+            return
+        self._title_bar_theme = palette.version
+        self.root.setProperty("textColor", palette.title_text)
+        self.root.setProperty("iconColor", palette.title_text)
+        self.root.setProperty("hoverColor", palette.button_hover)
+        self.root.setProperty("pressedColor", palette.button_pressed)
+
+    def _init_native_window(self):
+        super()._init_native_window()
+        self._native_window = int(self.winId())
+
+    def _on_effect_changed(self):
+        if self.effect_level == EffectLevel.SOLID:
+            color = QColor(SYSTEMTHEME.Palette.fallback_background)
+            color.setAlphaF(0.8)
+        else:
+            color = QColor(Qt.GlobalColor.transparent)
+        self.setColor(color)
+        self._apply_title_bar_theme()
+        self.update()
+
+    def _teardown_title_bar(self):
+        for signal, slot in self._title_bar_connections:
+            QObject.disconnect(self.root, SIGNAL(signal), slot)
+
+    def _update_frame_timing(self):
+        # timing a frame takes the GIL on the render thread, only do it
+        # while a governor or a profiler needs the frame times
+        enable = bool(getattr(self, "_effect_governor", None)
+                      or getattr(self, "_frame_profiler", None))
+        if enable == self._frame_timing:
+            return
+        self._frame_timing = enable
+        if enable:
+            self.beforeSynchronizing.connect(
+                self._frame_started, Qt.ConnectionType.DirectConnection)
+            self.frameSwapped.connect(
+                self._frame_swapped, Qt.ConnectionType.DirectConnection)
+        else:
+            self.beforeSynchronizing.disconnect(self._frame_started)
+            self.frameSwapped.disconnect(self._frame_swapped)
+            self._frame_start = None
+
+    def _frame_started(self):
+        # render thread
+        self._frame_start = perf_counter()
+
+    def _frame_swapped(self):
+        # render thread, the timestamps are recorded on the GUI thread
+        start, end = self._frame_start, perf_counter()
+        if start is not None:
+            self._frame_start = None
+            self._frame_timed.emit(end - start, end)
+
+    def _record_frame(self, duration, end):
+        if self._effect_governor:
+            self._effect_governor.record_frame(duration, end)
+        if self._frame_profiler:
+            self._frame_profiler.mark_repaint(FramePacingProfiler.WINDOW, end)
+            self._frame_profiler.mark_repaint(
+                FramePacingProfiler.TITLE_BAR, end)
+
+    def _toggle_max_state(self):
+        is_max = self.visibility() == QWindow.Visibility.Maximized
+        self.root.setProperty("maximized", not is_max)
+        if is_max:
+            self.showNormal()
+        else:
+            self.showMaximized()
+
+    def _start_move(self):
+        win32gui.ReleaseCapture()
+        win32api.SendMessage(
+            int(self.winId()),
+            win32con.WM_SYSCOMMAND, win32con.SC_MOVE | win32con.HTCAPTION, 0
+        )
+
+    def moveEvent(self, event):
+        if self.frame_profiler:
+            self.frame_profiler.mark_moved()
+        if self.effect_governor:
+            self.effect_governor.record_event()
+        if not self.is_win11:
+            self._temporary_disable_effect()
+        super().moveEvent(event)
+
+    def resizeEvent(self, event):
+        if self.effect_governor:
+            self.effect_governor.record_event()
+        if not self.use_mica:
+            self._temporary_disable_effect()
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        # QWindow.close() destroys the native window, the one created to
+        # show it again needs its animation and background effect back
+        if self.win_effects is not None \
+                and self._native_window != int(self.winId()):
+            # nothing is applied to the new window yet
+            self.effect_enabled = False
+            self.effect_level = EffectLevel.SOLID
+            self._init_native_window()
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        if event.isAccepted():
+            self._effect_timer.stop()
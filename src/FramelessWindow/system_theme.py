@@ -1,8 +1,50 @@
-import winreg
+from collections import namedtuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+
+from .backend import winreg
+
+
+class ThemePalette(namedtuple("ThemePalette", [
+        "version", "is_dark", "accent_rgb", "accent", "accent_hover",
+        "accent_pressed", "accent_disabled", "title_text",
+        "fallback_background", "button_hover", "button_pressed"])):
+    """ Snapshot of the system theme and the colors derived from it
+
+    Built once per theme change and never modified, compare `version`
+    to know whether anything has to be recomputed. The QColor fields are
+    shared by every reader, copy them before changing them, e.g.
+    `QColor(palette.accent)`.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, version, is_dark, accent_rgb):
+        accent = QColor.fromRgb(accent_rgb)
+        if is_dark:
+            hover, pressed = accent.lighter(110), accent.lighter(120)
+            text, background = QColor(Qt.GlobalColor.white), \
+                QColor(Qt.GlobalColor.black)
+            button = "FFFFFF"
+        else:
+            hover, pressed = accent.darker(110), accent.darker(120)
+            text, background = QColor(Qt.GlobalColor.black), \
+                QColor(Qt.GlobalColor.white)
+            button = "000000"
+
+        disabled = QColor(accent)
+        disabled.setAlpha(102)
+        return cls(
+            version, is_dark, accent_rgb, accent, hover, pressed, disabled,
+            text, background, QColor("#20" + button), QColor("#40" + button))
+
 
 class SYSTEMTHEME:
     IsDarkTheme = False
     AccentColor = 'rgb(0, 120, 215)'
+    Version = 0
+    Palette = ThemePalette.create(0, False, 0x0078D7)
 
     @classmethod
     def Update(cls):
@@ -10,14 +52,21 @@ class SYSTEMTHEME:
         name_theme = r"AppsUseLightTheme"
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, path_theme) as registry_key:
             value, regtype = winreg.QueryValueEx(registry_key, name_theme)
-            cls.IsDarkTheme = not bool(value)
+            is_dark = not bool(value)
 
         path_accent = r'SOFTWARE\\Microsoft\Windows\\CurrentVersion\\Explorer\\Accent'
         name_accent =   r"AccentColorMenu"
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, path_accent) as registry_key:
             value, regtype = winreg.QueryValueEx(registry_key, name_accent)
-            accent = value - 4278190080
-            accent = str(hex(accent)).split('x')[1]
-            accent = accent[4:6]+accent[2:4]+accent[0:2]
-            accent = 'rgb'+str(tuple(int(accent[i:i+2], 16) for i in (0, 2, 4)))
-            cls.AccentColor = accent
\ No newline at end of file
+            # the registry stores 0xAABBGGRR
+            accent_rgb = ((value & 0xFF) << 16) | (value & 0xFF00) \
+                | ((value >> 16) & 0xFF)
+
+        if is_dark == cls.IsDarkTheme and accent_rgb == cls.Palette.accent_rgb:
+            return
+
+        cls.IsDarkTheme = is_dark
+        cls.AccentColor = 'rgb' + str(
+            (accent_rgb >> 16, (accent_rgb >> 8) & 0xFF, accent_rgb & 0xFF))
+        cls.Version += 1
+        cls.Palette = ThemePalette.create(cls.Version, is_dark, accent_rgb)
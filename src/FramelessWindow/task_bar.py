@@ -1,8 +1,7 @@
-import win32con
-from ctypes import windll, byref, sizeof
+from ctypes import byref, sizeof
 from ctypes.wintypes import RECT
-from win32comext.shell import shellcon
 
+from .backend import win32con, windll, shellcon
 from .utils import APPBARDATA, get_monitor_info
 
 class Taskbar:
@@ -1,15 +1,14 @@
 from enum import Enum
-
-import win32api
-import win32con
-import win32gui
+from time import perf_counter
 
 from PySide6.QtCore import Qt, QPointF, QSize
-from PySide6.QtGui import QPainter, QPen, QPainterPath, QIcon
+from PySide6.QtGui import QPainter, QPen, QPainterPath, QIcon, QColor
 from PySide6.QtWidgets import QWidget, QToolButton, QLabel, QHBoxLayout
 
+from .backend import win32api, win32con, win32gui
 from .utils import *
 from .system_theme import SYSTEMTHEME
+from .animation import AnimationTicker, mix_colors
 from .resources import resources_rc
 
 class TitleBarButtonState(Enum):
@@ -19,36 +18,84 @@ class TitleBarButtonState(Enum):
 
 
 class TitleBarButton(QToolButton):
+    TRANSITION_DURATION = 0.15
+
     def __init__(self, parent):
         super().__init__(parent)
         self.setObjectName("TitleBarButton")
 
-        color_dark = "F" * 6
-        color_white = "0" * 6
-        self.colors = {
-            True: ("transparent", "#20" + color_dark, "#40" + color_dark),
-            False: ("transparent", "#20" + color_white, "#40" + color_white)
-        }
-        self._icon_color = {
-            True: Qt.GlobalColor.white,
-            False: Qt.GlobalColor.black
-        } 
+        self.set_colors(None)
         self._style = """
         border: none;
         margin: 0px;
+        background-color: transparent;
         """
+        self.setStyleSheet(self._style)
         self._state = TitleBarButtonState.NORMAL
-        self.set_state(TitleBarButtonState.NORMAL)
+        self._transparent = QColor(Qt.GlobalColor.transparent)
+        self._background = self._transparent
+        self._transition_from = None
+        self._transition_start = 0.0
+        self.set_state(TitleBarButtonState.NORMAL, animate=False)
         self.setFixedSize(46, 32)
 
+    def set_colors(self, colors):
+        """ Set the background colors of each state, per theme
+
+        The hover and pressed colors of `SYSTEMTHEME.Palette` are used
+        when `colors` is `None`.
+        """
+        self.colors = colors
+        self._colors = colors and {
+            dark: tuple(QColor(c) for c in values)
+            for dark, values in colors.items()
+        }
+
     def get_state(self):
         return self._state
 
-    def set_state(self, state):
+    def set_state(self, state, animate=True):
+        start = self._current_background()
         self._state = state
-        self.setStyleSheet(
-            f"background-color: {self.colors[SYSTEMTHEME.IsDarkTheme][state.value]};\n{self._style}")
-        
+        if not animate or not self.isVisible():
+            self._transition_from = None
+            AnimationTicker.instance().stop(self)
+        else:
+            self._transition_from = self._background = start
+            self._transition_start = perf_counter()
+            AnimationTicker.instance().start(self)
+        self.update()
+
+    def advance(self, now):
+        """ Advance the running color transition, called by the ticker """
+        progress = (now - self._transition_start) / self.TRANSITION_DURATION
+        if progress >= 1:
+            self._transition_from = None
+        else:
+            self._background = mix_colors(
+                self._transition_from, self._target_background(), progress)
+        self.update()
+        return self._transition_from is not None
+
+    def _target_background(self):
+        if self._colors:
+            return self._colors[SYSTEMTHEME.IsDarkTheme][self._state.value]
+        if self._state == TitleBarButtonState.HOVER:
+            return SYSTEMTHEME.Palette.button_hover
+        if self._state == TitleBarButtonState.PRESSED:
+            return SYSTEMTHEME.Palette.button_pressed
+        return self._transparent
+
+    def _current_background(self):
+        if self._transition_from is None:
+            return self._target_background()
+        return self._background
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._current_background())
+        painter.end()
+        super().paintEvent(event)
 
     def enterEvent(self, e):
         self.set_state(TitleBarButtonState.HOVER)
@@ -76,7 +123,7 @@ class MinimizeButton(TitleBarButton):
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
-        pen = QPen(self._icon_color[SYSTEMTHEME.IsDarkTheme])
+        pen = QPen(SYSTEMTHEME.Palette.title_text)
         pen.setCosmetic(True)
         painter.setPen(pen)
         painter.drawLine(18, 16, 28, 16)
@@ -91,7 +138,7 @@ class MaximizeButton(TitleBarButton):
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
-        pen = QPen(self._icon_color[SYSTEMTHEME.IsDarkTheme])
+        pen = QPen(SYSTEMTHEME.Palette.title_text)
         pen.setCosmetic(True)
         painter.setPen(pen)
 
@@ -118,11 +165,10 @@ class CloseButton(TitleBarButton):
     def __init__(self, parent):
         super().__init__(parent)
         self.setObjectName("CloseButton")
-        self.colors = {
+        self.set_colors({
             True: ("transparent", "#C42B1C", "#C83C30"),
             False: ("transparent", "#C42B1C", "#C83C30")
-        }
-        self.set_state(TitleBarButtonState.NORMAL)
+        })
         self._white_icon = QIcon(r":close_btn/white")
         self._black_icon = QIcon(r":close_btn/black")
         if SYSTEMTHEME.IsDarkTheme:
@@ -162,10 +208,8 @@ class TitleBar(QWidget):
         self.close_btn = CloseButton(self)
         self.h_box_layout = QHBoxLayout(self)
 
-        if SYSTEMTHEME.IsDarkTheme:
-            self.title.setStyleSheet("color: white")
-        else:
-            self.title.setStyleSheet("color: black")
+        self._theme_version = None
+        self._apply_theme()
         self.icon.setFixedSize(10, 16)
         self.h_box_layout.setSpacing(0)
         self.h_box_layout.setContentsMargins(0, 0, 0, 0)
@@ -180,12 +224,25 @@ class TitleBar(QWidget):
         self.max_btn.clicked.connect(self.__toggle_max_state)
         self.close_btn.clicked.connect(self.window().close)
     
+    def teardown(self):
+        """ Disconnect the buttons from the window and stop their transitions """
+        self.min_btn.clicked.disconnect()
+        self.max_btn.clicked.disconnect()
+        self.close_btn.clicked.disconnect()
+        ticker = AnimationTicker.instance()
+        for button in (self.min_btn, self.max_btn, self.close_btn):
+            ticker.stop(button)
+
+    def _apply_theme(self):
+        palette = SYSTEMTHEME.Palette
+        if self._theme_version == palette.version:
+            return
+        self._theme_version = palette.version
+        self.title.setStyleSheet(f"color: {palette.title_text.name()}")
+
     def paintEvent(self, event) -> None:
-        if SYSTEMTHEME.IsDarkTheme:
-            self.title.setStyleSheet("color: white")
-        else:
-            self.title.setStyleSheet("color: black")
-        return super().paintEvent(event)
+        self._apply_theme()
+        super().paintEvent(event)
 
     def __toggle_max_state(self):
         is_max = self.window().isMaximized()
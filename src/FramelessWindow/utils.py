@@ -1,12 +1,10 @@
-from ctypes import Structure, c_int, POINTER, windll, byref
-from ctypes.wintypes import DWORD, HWND, LPARAM, UINT, RECT
-
-import win32api
-import win32con
-import win32gui
+from ctypes import Structure, c_int, POINTER, byref
+from ctypes.wintypes import BYTE, DWORD, HWND, LPARAM, UINT, RECT
 
 from PySide6.QtGui import QGuiApplication
 
+from .backend import win32api, win32con, win32gui, windll
+
 
 class PWINDOWPOS(Structure):
     _fields_ = [
@@ -37,6 +35,17 @@ class APPBARDATA(Structure):
     ]
 
 
+class SYSTEM_POWER_STATUS(Structure):
+    _fields_ = [
+        ('ACLineStatus', BYTE),
+        ('BatteryFlag', BYTE),
+        ('BatteryLifePercent', BYTE),
+        ('SystemStatusFlag', BYTE),
+        ('BatteryLifeTime', DWORD),
+        ('BatteryFullLifeTime', DWORD)
+    ]
+
+
 
 def is_maximized(h_wnd):
     win_placement = win32gui.GetWindowPlacement(h_wnd)
@@ -96,3 +105,14 @@ def get_resize_border_thickness(h_wnd):
     windll.dwmapi.DwmIsCompositionEnabled(byref(b_result))
     thickness = 8 if bool(b_result.value) else 4
     return round(thickness * window.devicePixelRatio())
+
+
+def is_battery_saver_on():
+    status = SYSTEM_POWER_STATUS()
+    if not windll.kernel32.GetSystemPowerStatus(byref(status)):
+        return False
+    return bool(status.SystemStatusFlag & 1)
+
+
+def is_remote_session():
+    return bool(win32api.GetSystemMetrics(win32con.SM_REMOTESESSION))
@@ -1,11 +1,8 @@
-from ctypes import Structure, POINTER, c_int, sizeof, pointer, cdll, c_bool, \
-    byref
+from ctypes import Structure, POINTER, c_int, sizeof, pointer, c_bool, byref
 from ctypes.wintypes import DWORD, ULONG, BOOL, HRGN, LPCVOID, LONG
 from enum import Enum
-from sys import getwindowsversion
 
-import win32con
-import win32gui
+from .backend import win32con, win32gui, cdll, getwindowsversion
 
 
 class WINDOWCOMPOSITIONATTRIB(Enum):
@@ -62,6 +59,12 @@ class DWM_BLURBEHIND(Structure):
     ]
 
 
+def pack_gradient_color(color):
+    """ Pack a 'RRGGBBAA' hex string into the AABBGGRR DWORD value """
+    color = ''.join(color[i:i + 2] for i in range(6, -1, -2))
+    return int(color, base=16)
+
+
 class WindowsEffects:
     """ Class for applying Windows effects """
 
@@ -99,9 +102,9 @@ class WindowsEffects:
 
     def add_acrylic_effect(self, h_wnd, gradient_color,
                            enable_shadow=True, animation_id=0):
-        gradient_color = ''.join(gradient_color[i:i + 2]
-                                 for i in range(6, -1, -2))
-        gradient_color = DWORD(int(gradient_color, base=16))
+        if isinstance(gradient_color, str):
+            gradient_color = pack_gradient_color(gradient_color)
+        gradient_color = DWORD(gradient_color)
         accent_flags = DWORD(0x20 | 0x40 | 0x80 | 0x100) \
             if enable_shadow else DWORD(0)
         animation_id = DWORD(animation_id)
@@ -131,6 +134,15 @@ class WindowsEffects:
         else:
             self.dwm_set_win_attr(h_wnd, 1029, byref(c_int(1)), 4)
 
+    def remove_mica_effect(self, h_wnd):
+        """ Remove the DWM backdrop set by `add_mica_effect` """
+        h_wnd = int(h_wnd)
+        if getwindowsversion().build >= 22523:
+            # DWMSBT_NONE
+            self.dwm_set_win_attr(h_wnd, 38, byref(c_int(1)), 4)
+        else:
+            self.dwm_set_win_attr(h_wnd, 1029, byref(c_int(0)), 4)
+
     def remove_background_effect(self, h_wnd):
         self.accent_policy.AccentState = ACCENT_STATE.ACCENT_DISABLED.value
         self.set_win_comp_attr(int(h_wnd), pointer(self.win_comp_attr_data))
@@ -176,3 +188,14 @@ class WindowsEffects:
     def add_blur_behind_window(self, h_wnd):
         blur_behind = DWM_BLURBEHIND(1, True, 0, False)
         self.dwm_enable_blur_behind_win(int(h_wnd), byref(blur_behind))
+
+
+_shared_effects = None
+
+
+def shared_window_effects():
+    """ WindowsEffects instance shared by lightweight windows """
+    global _shared_effects
+    if _shared_effects is None:
+        _shared_effects = WindowsEffects()
+    return _shared_effects
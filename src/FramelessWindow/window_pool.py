@@ -0,0 +1,176 @@
+from functools import partial
+
+from PySide6.QtCore import Qt, QObject, QEvent, QTimer
+from PySide6.QtWidgets import QVBoxLayout
+
+from .frameless_window import FramelessWindowBase
+from .system_theme import SYSTEMTHEME
+
+
+class FramelessWindowPool(QObject):
+    """ Pool of pre-created hidden frameless windows
+
+    Windows are created during idle time, handed out with the content
+    swapped in and recycled when a close is accepted. Pooled windows are
+    never deleted on close, `WA_DeleteOnClose` is cleared.
+    """
+
+    def __init__(self, size=4, window_class=FramelessWindowBase, parent=None):
+        """ FramelessWindowPool
+
+        Parameters
+        ----------
+        size: int
+            maximum number of idle windows kept in the pool
+
+        window_class: type
+            class of the pooled windows, must be constructible without arguments
+
+        parent: QObject
+            parent object of the pool
+        """
+        super().__init__(parent)
+        self.size = size
+        self.window_class = window_class
+        self._idle = []
+        self._outstanding = []
+
+        # zero interval timer fires only when the event queue is empty
+        self._prefill_timer = QTimer(self)
+        self._prefill_timer.setInterval(0)
+        self._prefill_timer.timeout.connect(self._prefill_one)
+
+    @property
+    def idle_count(self):
+        """ Number of hidden windows ready to be acquired """
+        return len(self._idle)
+
+    @property
+    def outstanding_count(self):
+        """ Number of windows handed out and not released yet """
+        return len(self._outstanding)
+
+    def prefill(self):
+        """ Fill the pool in idle time, one window per event loop pass """
+        if not self._prefill_timer.isActive():
+            self._prefill_timer.start()
+
+    def acquire(self, content=None, title=None):
+        """ Take a window from the pool, or create one if the pool is empty """
+        self.evict_stale()
+        if self._idle:
+            window = self._idle.pop()
+        else:
+            window = self._create_window()
+        self._outstanding.append(window)
+
+        if content is not None:
+            self.set_content(window, content)
+        if title is not None:
+            window.setWindowTitle(title)
+
+        # replenish what was just handed out, leaving room for the
+        # outstanding windows to come back
+        if len(self._idle) < self._idle_target():
+            self.prefill()
+        return window
+
+    def set_content(self, window, content):
+        """ Replace the content widget of a pooled window """
+        self._take_content(window)
+        layout = window.layout()
+        if layout is None:
+            layout = QVBoxLayout(window)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(0)
+        layout.addWidget(content)
+        window._pool_content = content
+
+    def release(self, window):
+        """ Hide a window and put it back into the pool """
+        window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
+        window.hide()
+        self._take_content(window)
+        window.setWindowTitle("")
+        window.setWindowState(Qt.WindowState.WindowNoState)
+        window.setGeometry(window._pool_geometry)
+        if window in self._outstanding:
+            self._outstanding.remove(window)
+
+        if len(self._idle) >= self.size or self._is_stale(window):
+            self._discard(window)
+        elif window not in self._idle:
+            self._idle.append(window)
+
+    def evict_stale(self):
+        """ Drop idle windows created under another theme or DPI """
+        stale = [w for w in self._idle if self._is_stale(w)]
+        for window in stale:
+            self._idle.remove(window)
+            self._discard(window)
+
+    def clear(self):
+        """ Drop every idle window and stop recycling the outstanding ones """
+        self._prefill_timer.stop()
+        while self._idle:
+            self._discard(self._idle.pop())
+        while self._outstanding:
+            self._outstanding.pop().removeEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.Type.Close:
+            return super().eventFilter(obj, event)
+
+        # let the window's closeEvent decide and recycle an accepted close,
+        # Qt would delete the window afterwards with WA_DeleteOnClose
+        obj.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
+        obj.event(event)
+        if event.isAccepted():
+            self.release(obj)
+        return True
+
+    def _prefill_one(self):
+        self.evict_stale()
+        if len(self._idle) >= self._idle_target():
+            self._prefill_timer.stop()
+            return
+        self._idle.append(self._create_window())
+
+    def _create_window(self):
+        window = self.window_class()
+        window._pool_content = None
+        window._pool_stamp = self._stamp(window)
+        window._pool_geometry = window.geometry()
+        window.installEventFilter(self)
+        window.destroyed.connect(partial(self._forget, window))
+        return window
+
+    def _forget(self, window):
+        # deleted outside of the pool
+        if window in self._outstanding:
+            self._outstanding.remove(window)
+        if window in self._idle:
+            self._idle.remove(window)
+
+    def _idle_target(self):
+        return self.size - len(self._outstanding)
+
+    def _take_content(self, window):
+        content = window._pool_content
+        if content is None:
+            return
+        window.layout().removeWidget(content)
+        content.setParent(None)
+        window._pool_content = None
+
+    def _discard(self, window):
+        window.removeEventFilter(self)
+        window.teardown()
+        window.deleteLater()
+
+    @staticmethod
+    def _stamp(window):
+        return SYSTEMTHEME.Version, window.devicePixelRatioF()
+
+    def _is_stale(self, window):
+        return window._pool_stamp != self._stamp(window)